@@ -1,7 +1,8 @@
 use buildlog_consultant::common::find_build_failure_description;
 use buildlog_consultant::{Match, Problem};
 use clap::Parser;
-use std::cmp::{max, min};
+use std::cmp::min;
+use std::io::Write;
 use std::path::PathBuf;
 
 #[derive(Parser)]
@@ -83,25 +84,30 @@ pub fn main() -> Result<(), i8> {
             m.as_ref().map(|m| m.as_ref()),
             problem.as_ref().map(|p| p.as_ref()),
         );
-        serde_json::to_writer_pretty(std::io::stdout(), &ret).expect("Failed to write JSON");
+        // stdout is line buffered, which would mean a write per line of pretty-printed JSON.
+        let mut stdout = std::io::BufWriter::new(std::io::stdout().lock());
+        serde_json::to_writer_pretty(&mut stdout, &ret).expect("Failed to write JSON");
+        stdout.flush().expect("Failed to write JSON");
     } else {
         if let Some(m) = m {
-            if m.linenos().len() == 1 {
+            let linenos = m.linenos();
+            if linenos.len() == 1 {
                 log::info!("Issue found at line {}:", m.lineno());
             } else {
                 log::info!(
                     "Issue found at lines {}-{}:",
-                    m.linenos().first().unwrap(),
-                    m.linenos().last().unwrap()
+                    linenos.first().unwrap(),
+                    linenos.last().unwrap()
                 );
             }
-            for i in max(0, m.offsets()[0] - args.context)
-                ..min(lines.len(), m.offsets().last().unwrap() + args.context + 1)
-            {
+            let offsets = m.offsets();
+            let start = offsets[0].saturating_sub(args.context);
+            let end = min(lines.len(), offsets.last().unwrap() + args.context + 1);
+            for (i, line) in lines.iter().enumerate().take(end).skip(start) {
                 log::info!(
                     " {}  {}",
-                    if m.offsets().contains(&i) { ">" } else { " " },
-                    lines[i].trim_end_matches('\n')
+                    if offsets.contains(&i) { ">" } else { " " },
+                    line.trim_end_matches('\n')
                 );
             }
         } else {
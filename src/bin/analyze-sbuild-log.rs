@@ -1,6 +1,7 @@
 use buildlog_consultant::sbuild::{worker_failure_from_sbuild_log, SbuildLog};
 use buildlog_consultant::{Match, Problem};
 use clap::Parser;
+use std::io::Write;
 use std::path::PathBuf;
 
 #[derive(Parser)]
@@ -94,7 +95,10 @@ pub fn main() -> Result<(), i8> {
             failure.r#match.as_ref().map(|m| m.as_ref()),
             failure.error.as_ref().map(|p| p.as_ref()),
         );
-        serde_json::to_writer_pretty(std::io::stdout(), &ret).expect("Failed to write JSON");
+        // stdout is line buffered, which would mean a write per line of pretty-printed JSON.
+        let mut stdout = std::io::BufWriter::new(std::io::stdout().lock());
+        serde_json::to_writer_pretty(&mut stdout, &ret).expect("Failed to write JSON");
+        stdout.flush().expect("Failed to write JSON");
     } else {
         if let Some(failed_stage) = failed_stage {
             log::info!("Failed stage: {}", failed_stage);
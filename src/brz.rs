@@ -89,20 +89,37 @@ macro_rules! regex_line_matcher {
     };
 }
 
+type BrzErrorParser = fn(&regex::Captures, Vec<&str>) -> Option<Box<dyn Problem>>;
+
 lazy_static::lazy_static! {
-    static ref BRZ_ERRORS: Vec<(regex::Regex, fn(&regex::Captures, Vec<&str>) -> Option<Box<dyn Problem>>)> = vec![
-        regex_line_matcher!("Unable to find the needed upstream tarball for package (.*), version (.*)\\.",
-        |m, _| Some(Box::new(UnableToFindUpstreamTarball{package: m.get(1).unwrap().as_str().to_string(), version: m.get(2).unwrap().as_str().parse().unwrap()}))),
-        regex_line_matcher!("Unknown mercurial extra fields in (.*): b'(.*)'.", |m, _| Some(Box::new(UnknownMercurialExtraFields(m.get(2).unwrap().as_str().to_string())))),
-        regex_line_matcher!("UScan failed to run: In watchfile (.*), reading webpage (.*) failed: 429 too many requests\\.", |m, _| Some(Box::new(UScanTooManyRequests(m.get(2).unwrap().as_str().to_string())))),
-        regex_line_matcher!("UScan failed to run: OpenPGP signature did not verify..", |_, _| Some(Box::new(UpstreamPGPSignatureVerificationFailed))),
-        regex_line_matcher!(r"Inconsistency between source format and version: version is( not)? native, format is( not)? native\.", |m, _| Some(Box::new(InconsistentSourceFormat{version: m.get(1).is_some(), source_format: m.get(2).is_some()}))),
-        regex_line_matcher!(r"UScan failed to run: In (.*) no matching hrefs for version (.*) in watch line", |m, _| Some(Box::new(UScanRequestVersionMissing(m.get(2).unwrap().as_str().to_string())))),
-        regex_line_matcher!(r"UScan failed to run: In directory ., downloading (.*) failed: (.*)", |m, _| Some(Box::new(UScanFailed{url: m.get(1).unwrap().as_str().to_string(), reason: m.get(2).unwrap().as_str().to_string()}))),
-        regex_line_matcher!(r"UScan failed to run: In watchfile debian/watch, reading webpage\n  (.*) failed: (.*)", |m, _| Some(Box::new(UScanFailed{url: m.get(1).unwrap().as_str().to_string(), reason: m.get(2).unwrap().as_str().to_string()}))),
-        regex_line_matcher!(r"Unable to parse upstream metadata file (.*): (.*)", |m, _| Some(Box::new(UpstreamMetadataFileParseError{path: m.get(1).unwrap().as_str().to_string().into(), reason: m.get(2).unwrap().as_str().to_string()}))),
-        regex_line_matcher!(r"Debcargo failed to run\.", parse_debcargo_failure),
-        regex_line_matcher!(r"\[Errno 28\] No space left on device", |_, _| Some(Box::new(NoSpaceOnDevice)))
+    /// Known brz errors, bucketed by the literal prefix their patterns start with.
+    ///
+    /// Only the patterns in a bucket whose prefix matches the line are tried, so patterns in a
+    /// prefixed bucket are anchored at the start of the line. The bucket with the empty prefix
+    /// holds the patterns that can match anywhere in the line and is always tried last.
+    static ref BRZ_ERRORS: Vec<(&'static str, Vec<(regex::Regex, BrzErrorParser)>)> = vec![
+        ("Unable to ", vec![
+            regex_line_matcher!("^Unable to find the needed upstream tarball for package (.*), version (.*)\\.",
+            |m, _| Some(Box::new(UnableToFindUpstreamTarball{package: m.get(1).unwrap().as_str().to_string(), version: m.get(2).unwrap().as_str().parse().unwrap()}))),
+            regex_line_matcher!(r"^Unable to parse upstream metadata file (.*): (.*)", |m, _| Some(Box::new(UpstreamMetadataFileParseError{path: m.get(1).unwrap().as_str().to_string().into(), reason: m.get(2).unwrap().as_str().to_string()}))),
+        ]),
+        ("Unknown mercurial extra fields in ", vec![
+            regex_line_matcher!("^Unknown mercurial extra fields in (.*): b'(.*)'.", |m, _| Some(Box::new(UnknownMercurialExtraFields(m.get(2).unwrap().as_str().to_string())))),
+        ]),
+        ("UScan failed to run: ", vec![
+            regex_line_matcher!("^UScan failed to run: In watchfile (.*), reading webpage (.*) failed: 429 too many requests\\.", |m, _| Some(Box::new(UScanTooManyRequests(m.get(2).unwrap().as_str().to_string())))),
+            regex_line_matcher!(r"^UScan failed to run: OpenPGP signature did not verify\.", |_, _| Some(Box::new(UpstreamPGPSignatureVerificationFailed))),
+            regex_line_matcher!(r"^UScan failed to run: In (.*) no matching hrefs for version (.*) in watch line", |m, _| Some(Box::new(UScanRequestVersionMissing(m.get(2).unwrap().as_str().to_string())))),
+            regex_line_matcher!(r"^UScan failed to run: In directory ., downloading (.*) failed: (.*)", |m, _| Some(Box::new(UScanFailed{url: m.get(1).unwrap().as_str().to_string(), reason: m.get(2).unwrap().as_str().to_string()}))),
+            regex_line_matcher!(r"^UScan failed to run: In watchfile debian/watch, reading webpage\n  (.*) failed: (.*)", |m, _| Some(Box::new(UScanFailed{url: m.get(1).unwrap().as_str().to_string(), reason: m.get(2).unwrap().as_str().to_string()}))),
+        ]),
+        ("Inconsistency between source format and version: ", vec![
+            regex_line_matcher!(r"^Inconsistency between source format and version: version is( not)? native, format is( not)? native\.", |m, _| Some(Box::new(InconsistentSourceFormat{version: m.get(1).is_some(), source_format: m.get(2).is_some()}))),
+        ]),
+        ("", vec![
+            regex_line_matcher!(r"Debcargo failed to run\.", parse_debcargo_failure),
+            regex_line_matcher!(r"\[Errno 28\] No space left on device", |_, _| Some(Box::new(NoSpaceOnDevice))),
+        ]),
     ];
 }
 
@@ -111,11 +128,16 @@ pub fn parse_brz_error<'a>(
     prior_lines: Vec<&'a str>,
 ) -> (Option<Box<dyn Problem>>, String) {
     let line = line.trim();
-    for (re, f) in BRZ_ERRORS.iter() {
-        if let Some(m) = re.captures(line) {
-            let err = f(&m, prior_lines);
-            let description = err.as_ref().unwrap().to_string();
-            return (err, description);
+    for (prefix, matchers) in BRZ_ERRORS.iter() {
+        if !line.starts_with(prefix) {
+            continue;
+        }
+        for (re, f) in matchers.iter() {
+            if let Some(m) = re.captures(line) {
+                let err = f(&m, prior_lines);
+                let description = err.as_ref().unwrap().to_string();
+                return (err, description);
+            }
         }
     }
     if let Some(suffix) = line.strip_prefix("UScan failed to run: ") {
@@ -132,7 +154,7 @@ pub fn parse_brz_error<'a>(
             line.to_string(),
         );
     }
-    return (None, line.split_once('\n').unwrap().0.to_string());
+    (None, line.lines().next().unwrap_or(line).to_string())
 }
 
 #[cfg(test)]
@@ -156,6 +178,78 @@ mod tests {
         );
     }
 
+    #[test]
+    fn test_uscan_error() {
+        let (err, line) = parse_brz_error(
+            "UScan failed to run: OpenPGP signature did not verify.",
+            vec![],
+        );
+        assert_eq!(
+            Some(Box::new(UpstreamPGPSignatureVerificationFailed) as Box<dyn Problem>),
+            err
+        );
+        assert_eq!(line, UpstreamPGPSignatureVerificationFailed.to_string());
+
+        let (err, line) = parse_brz_error("UScan failed to run: something went wrong", vec![]);
+        assert_eq!(
+            Some(Box::new(UScanError("something went wrong".to_string())) as Box<dyn Problem>),
+            err
+        );
+        assert_eq!(line, "UScan failed to run: something went wrong");
+    }
+
+    #[test]
+    fn test_upstream_metadata_parse_error() {
+        let (err, line) = parse_brz_error(
+            "Unable to parse upstream metadata file debian/upstream/metadata: invalid YAML",
+            vec![],
+        );
+        let expected: Box<dyn Problem> = Box::new(UpstreamMetadataFileParseError {
+            path: "debian/upstream/metadata".into(),
+            reason: "invalid YAML".to_string(),
+        });
+        assert_eq!(line, expected.to_string());
+        assert_eq!(Some(expected), err);
+    }
+
+    #[test]
+    fn test_prefixed_patterns_are_anchored() {
+        let (err, line) = parse_brz_error(
+            "Error: Unable to parse upstream metadata file debian/upstream/metadata: invalid YAML",
+            vec![],
+        );
+        assert!(err.is_none());
+        assert_eq!(
+            line,
+            "Error: Unable to parse upstream metadata file debian/upstream/metadata: invalid YAML"
+        );
+    }
+
+    #[test]
+    fn test_unknown_error() {
+        let (err, line) = find_brz_build_error(vec!["brz: ERROR: foo\n"]).unwrap();
+        assert!(err.is_none());
+        assert_eq!(line, "foo");
+
+        let (err, line) = parse_brz_error("Something went wrong\n  with details", vec![]);
+        assert!(err.is_none());
+        assert_eq!(line, "Something went wrong");
+    }
+
+    #[test]
+    fn test_no_space_on_device() {
+        let (err, line) = parse_brz_error("[Errno 28] No space left on device: '/tmp/foo'", vec![]);
+        assert_eq!(Some(Box::new(NoSpaceOnDevice) as Box<dyn Problem>), err);
+        assert_eq!(line, NoSpaceOnDevice.to_string());
+
+        // Patterns in the fallback bucket are not anchored.
+        let (err, _) = parse_brz_error(
+            "Failed to write: [Errno 28] No space left on device",
+            vec![],
+        );
+        assert_eq!(Some(Box::new(NoSpaceOnDevice) as Box<dyn Problem>), err);
+    }
+
     #[test]
     fn test_missing_debcargo_crate() {
         let lines = vec![
@@ -360,11 +360,10 @@ impl Matcher for MultiLineVignetteErrorMatcher {
         lines: &[&str],
         offset: usize,
     ) -> Result<Option<(Box<dyn Match>, Option<Box<dyn Problem>>)>, Error> {
-        let header_m =
-            regex::Regex::new(r"^Error: processing vignette '(.*)' failed with diagnostics:")
-                .unwrap();
-
-        if !header_m.is_match(lines[offset]) {
+        if !regex_is_match!(
+            r"^Error: processing vignette '(.*)' failed with diagnostics:",
+            lines[offset]
+        ) {
             return Ok(None);
         }
 
@@ -456,6 +455,11 @@ fn webpack_file_missing(m: &regex::Captures) -> Result<Option<Box<dyn Problem>>,
     Ok(None)
 }
 
+/// Split the "@INC contains: ..." list from a perl error into its directories.
+fn perl_inc(inc: &str) -> Vec<String> {
+    inc.split_whitespace().map(|s| s.to_string()).collect()
+}
+
 fn ruby_missing_gem(m: &regex::Captures) -> Result<Option<Box<dyn Problem>>, Error> {
     let mut minimum_version = None;
     for grp in m.get(2).unwrap().as_str().split(",") {
@@ -1012,7 +1016,7 @@ lazy_static::lazy_static! {
         r".*Can't locate (.*).pm in @INC \(you may need to install the (.*) module\) \(@INC contains: (.*)\) at .* line [0-9]+\.",
         |m| {
             let path = format!("{}.pm", m.get(1).unwrap().as_str());
-            let inc = m.get(3).unwrap().as_str().split(' ').map(|s| s.to_string()).collect::<Vec<_>>();
+            let inc = perl_inc(m.get(3).unwrap().as_str());
 
             Ok(Some(Box::new(MissingPerlModule{ filename: Some(path), module: m.get(2).unwrap().as_str().to_string(), minimum_version: None, inc: Some(inc)})))
         }
@@ -1021,7 +1025,7 @@ lazy_static::lazy_static! {
         r".*Can't locate (.*).pm in @INC \(you may need to install the (.*) module\) \(@INC contains: (.*)\)\.",
         |m| {
             let path = format!("{}.pm", m.get(1).unwrap().as_str());
-            let inc = m.get(3).unwrap().as_str().split(' ').map(|s| s.to_string()).collect::<Vec<_>>();
+            let inc = perl_inc(m.get(3).unwrap().as_str());
 
             Ok(Some(Box::new(MissingPerlModule{ filename: Some(path), module: m.get(2).unwrap().as_str().to_string(), inc: Some(inc), minimum_version: None })))
         }
@@ -1062,7 +1066,7 @@ lazy_static::lazy_static! {
     regex_line_matcher!(
         r".*Can't locate (.*) in @INC \(@INC contains: (.*)\) at .* line .*.",
         |m| {
-            let inc = m.get(2).unwrap().as_str().split(' ').map(|s| s.to_string()).collect::<Vec<_>>();
+            let inc = perl_inc(m.get(2).unwrap().as_str());
             Ok(Some(Box::new(MissingPerlFile::new(m.get(1).unwrap().as_str().to_string(), Some(inc)))))
         }),
 
@@ -2926,14 +2930,14 @@ impl Matcher for CMakeErrorMatcher {
         lines: &[&str],
         offset: usize,
     ) -> Result<Option<(Box<dyn Match>, Option<Box<dyn Problem>>)>, Error> {
-        let (_path, _start_linenos) = if let Some((_, _, path, start_lineno, _)) = lazy_regex::regex_captures!(
-            r"CMake (Error|Warning) at (.+):([0-9]+) \((.*)\):",
-            lines[offset].trim_end_matches('\n')
-        ) {
-            (path, start_lineno.parse::<usize>().unwrap())
-        } else {
+        let line = lines[offset].trim_end_matches('\n');
+        let re = lazy_regex::regex!(r"CMake (Error|Warning) at (.+):([0-9]+) \((.*)\):");
+        // This runs for every line; check for a match before paying for capture extraction.
+        if !re.is_match(line) {
             return Ok(None);
-        };
+        }
+        let c = re.captures(line).unwrap();
+        let (_path, _start_linenos) = (&c[2], c[3].parse::<usize>().unwrap());
 
         let (linenos, error_string) = extract_cmake_error_lines(lines, offset);
 
@@ -3043,7 +3047,7 @@ lazy_static::lazy_static! {
     r"\! Emergency stop\."),
     secondary_matcher!(r"\!pdfTeX error: pdflatex: fwrite\(\) failed"),
     // inkscape
-    secondary_matcher!(r"Unknown option (?!.*ignoring.*)"),
+    secondary_matcher!(r"Unknown option (?!.*ignoring)"),
     // CTest
     secondary_matcher!(
     r"not ok [0-9]+ .*"),
@@ -3157,7 +3161,7 @@ lazy_static::lazy_static! {
     secondary_matcher!(
     "FAIL\t(.*)\t[0-9.]+s"),
     secondary_matcher!(
-    r".*.go:[0-9]+:[0-9]+: (?!note:).*"),
+    r".go:[0-9]+:[0-9]+: (?!note:)"),
     secondary_matcher!(
     r"can\'t load package: package \.: no Go files in /<<PKGBUILDDIR>>/(.*)"),
     // Ld
@@ -3388,17 +3392,22 @@ pub fn find_build_failure_description(
                 r#"\s*The imported target "(.*)" references the file"#,
                 line
             ) {
+                // Skip the blank line(s) between the header and the quoted filename.
                 lineno += 1;
-                while lineno < lines.len() && !line.is_empty() {
+                while lineno < lines.len() && lines[lineno].trim().is_empty() {
                     lineno += 1;
                 }
-                if lines[lineno + 2].starts_with("  but this file does not exist.") {
+                if lines
+                    .get(lineno + 2)
+                    .map_or(false, |l| l.starts_with("  but this file does not exist."))
+                {
+                    let entry_line = lines[lineno].trim_end_matches('\n');
                     let filename = if let Some((_, entry)) =
-                        lazy_regex::regex_captures!(r#"\s*"(.*)""#, line)
+                        lazy_regex::regex_captures!(r#"\s*"(.*)""#, entry_line)
                     {
                         entry
                     } else {
-                        line
+                        entry_line
                     };
                     return (
                         Some(Box::new(SingleLineMatch::from_lines(
@@ -3413,12 +3422,21 @@ pub fn find_build_failure_description(
                 }
                 continue;
             }
-            if lineno + 1 < lines.len() {
+            // The message may be wrapped onto the next line, so the regex runs on both lines
+            // joined together. Only build that string if this line could be the start of it.
+            const CMAKE_PACKAGE_CONFIG_PREFIX: &str =
+                "  Could not find a package configuration file provided by \"";
+            let may_start_package_config = if line.len() >= CMAKE_PACKAGE_CONFIG_PREFIX.len() {
+                line.starts_with(CMAKE_PACKAGE_CONFIG_PREFIX)
+            } else {
+                !line.is_empty() && CMAKE_PACKAGE_CONFIG_PREFIX.starts_with(line)
+            };
+            if may_start_package_config && lineno + 1 < lines.len() {
                 if let Some((_, _pkg)) = lazy_regex::regex_captures!("^  Could not find a package configuration file provided by \"(.*)\" with any of the following names:", &(line.to_string() + " " + lines[lineno + 1].trim_start_matches(' ').trim_end_matches('\n'))) {
-                    if lines[lineno + 2] == "\n" {
+                    if lines.get(lineno + 2) == Some(&"\n") {
                         let mut i = 3;
                         let mut filenames = vec![];
-                        while !lines[lineno + i].trim().is_empty() {
+                        while lineno + i < lines.len() && !lines[lineno + i].trim().is_empty() {
                             filenames.push(lines[lineno + i].trim().to_string());
                             i += 1;
                         }
@@ -5519,6 +5537,49 @@ dh_auto_configure: cd obj-x86_64-linux-gnu && cmake with args
         );
     }
 
+    #[test]
+    fn test_cmake_missing_file_without_header() {
+        assert_match(
+            vec![
+                "-- Looking for Qt5 with cmake\n",
+                "  The imported target \"Qt5::Gui\" references the file\n",
+                "\n",
+                "     \"/usr/lib/x86_64-linux-gnu/libEGL.so\"\n",
+                "\n",
+                "  but this file does not exist.  Possible reasons include:\n",
+            ],
+            4,
+            Some(MissingFile::new(
+                "/usr/lib/x86_64-linux-gnu/libEGL.so".into(),
+            )),
+        );
+    }
+
+    #[test]
+    fn test_cmake_missing_cmake_files_truncated() {
+        assert_match(
+            vec![
+                "-- Looking for sensor_msgs with cmake\n",
+                "  Could not find a package configuration file provided by \"sensor_msgs\" with\n",
+                "  any of the following names:\n",
+                "\n",
+                "    sensor_msgsConfig.cmake\n",
+            ],
+            2,
+            Some(CMakeFilesMissing {
+                filenames: vec!["sensor_msgsConfig.cmake".to_string()],
+                version: None,
+            }),
+        );
+        let (r#match, err) = super::find_build_failure_description(vec![
+            "-- Looking for sensor_msgs with cmake\n",
+            "  Could not find a package configuration file provided by \"sensor_msgs\" with\n",
+            "  any of the following names:\n",
+        ]);
+        assert!(r#match.is_none());
+        assert!(err.is_none());
+    }
+
     #[test]
     fn test_cmake_missing_include() {
         assert_match(
@@ -227,23 +227,26 @@ pub mod r#match;
 pub mod sbuild;
 
 pub fn highlight_lines(lines: &[&str], m: &dyn Match, context: usize) {
-    use std::cmp::{max, min};
-    if m.linenos().len() == 1 {
+    use std::cmp::min;
+    // offsets() and linenos() build a new Vec on every call, so fetch them once.
+    let linenos = m.linenos();
+    if linenos.len() == 1 {
         println!("Issue found at line {}:", m.lineno());
     } else {
         println!(
             "Issue found at lines {}-{}:",
-            m.linenos().first().unwrap(),
-            m.linenos().last().unwrap()
+            linenos.first().unwrap(),
+            linenos.last().unwrap()
         );
     }
-    for i in max(0, m.offsets()[0] - context)
-        ..min(lines.len(), m.offsets().last().unwrap() + context + 1)
-    {
+    let offsets = m.offsets();
+    let start = offsets[0].saturating_sub(context);
+    let end = min(lines.len(), offsets.last().unwrap() + context + 1);
+    for (i, line) in lines.iter().enumerate().take(end).skip(start) {
         println!(
             " {}  {}",
-            if m.offsets().contains(&i) { ">" } else { " " },
-            lines[i].trim_end_matches('\n')
+            if offsets.contains(&i) { ">" } else { " " },
+            line.trim_end_matches('\n')
         );
     }
 }
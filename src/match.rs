@@ -42,6 +42,11 @@ impl RegexLineMatcher {
     }
 
     pub fn extract_from_line(&self, line: &str) -> Result<Option<Option<Box<dyn Problem>>>, Error> {
+        // Most lines don't match; is_match() can reject them without allocating the capture
+        // slots that captures() sets up for every call.
+        if !self.regex.is_match(line) {
+            return Ok(None);
+        }
         let c = self.regex.captures(line);
         if let Some(c) = c {
             return Ok(Some((self.callback)(&c)?));
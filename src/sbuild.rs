@@ -201,8 +201,8 @@ impl FromStr for SbuildLog {
     type Err = std::io::Error;
 
     fn from_str(s: &str) -> Result<Self, Self::Err> {
-        let reader = BufReader::new(s.as_bytes());
-        let sections = parse_sbuild_log(reader);
+        // &[u8] is already a BufRead, so lines can be read straight out of the string.
+        let sections = parse_sbuild_log(s.as_bytes());
         Ok(SbuildLog(sections.collect()))
     }
 }
@@ -220,6 +220,20 @@ impl SbuildLogSection {
     }
 }
 
+/// Read a line as raw bytes, only paying for a lossy conversion if it isn't valid UTF-8.
+///
+/// Build logs regularly contain output in other encodings, which would make
+/// `BufRead::read_line` fail.
+fn read_line_lossy<R: BufRead>(reader: &mut R, line: &mut String) -> std::io::Result<usize> {
+    let mut buf = Vec::new();
+    let n = reader.read_until(b'\n', &mut buf)?;
+    *line = match String::from_utf8(buf) {
+        Ok(s) => s,
+        Err(e) => String::from_utf8_lossy(e.as_bytes()).into_owned(),
+    };
+    Ok(n)
+}
+
 pub fn parse_sbuild_log<R: BufRead>(mut reader: R) -> impl Iterator<Item = SbuildLogSection> {
     let mut begin_offset = 1;
     let mut lines = Vec::new();
@@ -236,22 +250,19 @@ pub fn parse_sbuild_log<R: BufRead>(mut reader: R) -> impl Iterator<Item = Sbuil
         let mut line = String::new();
 
         // Read a line from the file. Break if EOF.
-        if reader.read_line(&mut line).unwrap() == 0 {
+        if read_line_lossy(&mut reader, &mut line).unwrap() == 0 {
             break;
         }
 
         lineno += 1;
 
-        // Trim trailing whitespace and newline characters.
-        let line_trimmed = line.trim().to_string();
-
-        if line_trimmed == sep {
+        if line.trim() == sep {
             // Read next two lines
             let mut l1 = String::new();
             let mut l2 = String::new();
 
-            reader.read_line(&mut l1).unwrap();
-            reader.read_line(&mut l2).unwrap();
+            read_line_lossy(&mut reader, &mut l1).unwrap();
+            read_line_lossy(&mut reader, &mut l2).unwrap();
 
             lineno += 2;
 
@@ -263,22 +274,23 @@ pub fn parse_sbuild_log<R: BufRead>(mut reader: R) -> impl Iterator<Item = Sbuil
                 let mut end_offset = lineno - 3;
 
                 // Drop trailing empty lines
-                while lines.last() == Some(&"\n".to_string()) {
+                while lines.last().map(String::as_str) == Some("\n") {
                     lines.pop();
                     end_offset -= 1;
                 }
 
-                if !lines.is_empty() {
-                    // The unwrap_or_else is to provide a default value in case 'title' is None.
+                // Hand the collected lines over to the section rather than copying them, so
+                // a section is only ever held in memory once.
+                let section_lines = std::mem::take(&mut lines);
+                let section_title = title.replace(l1_trimmed.trim_matches('|').trim().to_string());
+                if !section_lines.is_empty() {
                     sections.push(SbuildLogSection {
-                        title: title.clone(),
+                        title: section_title,
                         offsets: (begin_offset, end_offset),
-                        lines: lines.clone(),
+                        lines: section_lines,
                     });
                 }
 
-                title = Some(l1_trimmed.trim_matches('|').trim().to_string());
-                lines.clear();
                 begin_offset = lineno;
             } else {
                 lines.push(line);
@@ -677,6 +689,11 @@ impl std::fmt::Display for Phase {
     }
 }
 
+/// Description to use for a failure at `failed_stage` when no more specific one is available.
+fn default_description(failed_stage: &str) -> String {
+    format!("build failed stage {}", failed_stage)
+}
+
 pub const DEFAULT_LOOK_BACK: usize = 50;
 
 pub fn strip_build_tail<'a>(
@@ -756,7 +773,7 @@ pub fn find_failure_fetch_src(sbuildlog: &SbuildLog, failed_stage: &str) -> Opti
         });
     }
     let (r#match, error) = crate::apt::find_apt_get_failure(section.lines());
-    let description = format!("build failed stage {}", failed_stage);
+    let description = default_description(failed_stage);
     Some(SbuildFailure {
         stage: Some(failed_stage.to_string()),
         description: Some(description),
@@ -774,7 +791,7 @@ pub fn find_failure_create_session(
     let section = sbuildlog.get_section(None)?;
     let (r#match, error) = find_creation_session_error(section.lines());
     let phase = Phase::CreateSession;
-    let description = format!("build failed stage {}", failed_stage);
+    let description = default_description(failed_stage);
     Some(SbuildFailure {
         stage: Some(failed_stage.to_owned()),
         description: Some(description),
@@ -846,7 +863,7 @@ pub fn find_failure_unpack(sbuildlog: &SbuildLog, failed_stage: &str) -> Option<
             });
         }
     }
-    let description = format!("build failed stage {}", failed_stage);
+    let description = default_description(failed_stage);
     Some(SbuildFailure {
         stage: Some(failed_stage.to_string()),
         description: Some(description),
@@ -872,7 +889,7 @@ pub fn find_failure_build(sbuildlog: &SbuildLog, failed_stage: &str) -> Option<S
     } else if let Some(r#match) = r#match.as_ref() {
         r#match.line().trim_end_matches('\n').to_string()
     } else {
-        format!("build failed stage {}", failed_stage)
+        default_description(failed_stage)
     };
     Some(SbuildFailure {
         stage: Some(failed_stage.to_string()),
@@ -894,7 +911,7 @@ pub fn find_failure_apt_get_update(
     } else if let Some(r#match) = r#match.as_ref() {
         r#match.line().trim_end_matches('\n').to_string()
     } else {
-        format!("build failed stage {}", failed_stage)
+        default_description(failed_stage)
     };
     Some(SbuildFailure {
         stage: Some(failed_stage.to_string()),
@@ -910,10 +927,13 @@ fn find_arch_check_failure_description(
     lines: Vec<&str>,
 ) -> (Option<Box<dyn Match>>, Option<Box<dyn Problem>>) {
     for (offset, line) in lines.enumerate_forward(None) {
-        if let Some((_, arch, arch_list)) = lazy_regex::regex_captures!(
-            "E: dsc: (.*) not in arch list or does not match any arch wildcards: (.*) -- skipping",
-            line
-        ) {
+        // Only the part after the literal prefix needs to go through the regex.
+        if let Some((_, arch, arch_list)) = line.strip_prefix("E: dsc: ").and_then(|rest| {
+            lazy_regex::regex_captures!(
+                "^(.*) not in arch list or does not match any arch wildcards: (.*) -- skipping",
+                rest
+            )
+        }) {
             let error = ArchitectureNotInList {
                 arch: arch.to_string(),
                 arch_list: arch_list
@@ -931,14 +951,15 @@ fn find_arch_check_failure_description(
             );
         }
     }
-    (
-        Some(Box::new(SingleLineMatch::from_lines(
+    // Point at the last line when nothing matched; an empty section has no line to point at.
+    let r#match = lines.len().checked_sub(1).map(|offset| {
+        Box::new(SingleLineMatch::from_lines(
             &lines,
-            lines.len() - 1,
+            offset,
             Some("direct regex"),
-        ))),
-        None,
-    )
+        )) as Box<dyn Match>
+    });
+    (r#match, None)
 }
 
 pub fn find_failure_arch_check(sbuildlog: &SbuildLog, failed_stage: &str) -> Option<SbuildFailure> {
@@ -949,7 +970,7 @@ pub fn find_failure_arch_check(sbuildlog: &SbuildLog, failed_stage: &str) -> Opt
     let description = if let Some(error) = error.as_ref() {
         error.to_string()
     } else {
-        format!("build failed stage {}", failed_stage)
+        default_description(failed_stage)
     };
     Some(SbuildFailure {
         stage: Some(failed_stage.to_string()),
@@ -970,7 +991,7 @@ pub fn find_failure_check_space(
     let description = if let Some(ref error) = error {
         error.to_string()
     } else {
-        format!("build failed stage {}", failed_stage)
+        default_description(failed_stage)
     };
     Some(SbuildFailure {
         stage: Some(failed_stage.to_string()),
@@ -1047,7 +1068,7 @@ pub fn find_failure_install_deps(
             r#match.line().trim_end_matches('\n').to_string()
         }
     } else {
-        format!("build failed stage {}", failed_stage)
+        default_description(failed_stage)
     };
     let phase = Phase::Build;
     Some(SbuildFailure {
@@ -1082,7 +1103,7 @@ pub fn find_failure_autopkgtest(
     } else {
         (None, None, None, None)
     };
-    let description = description.unwrap_or_else(|| format!("build failed stage {}", failed_stage));
+    let description = description.unwrap_or_else(|| default_description(failed_stage));
     Some(SbuildFailure {
         stage: Some(failed_stage.to_string()),
         description: Some(description),
@@ -1143,7 +1164,7 @@ pub fn worker_failure_from_sbuild_log(sbuildlog: &SbuildLog) -> SbuildFailure {
         return overall_failure;
     } else if let Some(failed_stage) = failed_stage {
         log::warn!("unknown failed stage: {}", failed_stage);
-        let description = format!("build failed stage {}", failed_stage);
+        let description = default_description(&failed_stage);
         return SbuildFailure {
             stage: Some(failed_stage),
             description: Some(description),
@@ -1193,12 +1214,19 @@ pub fn worker_failure_from_sbuild_log(sbuildlog: &SbuildLog) -> SbuildFailure {
 fn find_check_space_failure_description(
     lines: Vec<&str>,
 ) -> (Option<Box<dyn Match>>, Option<Box<dyn Problem>>) {
-    for (offset, line) in lines.enumerate_forward(None) {
+    // The disk space check runs at the very end of the build, so look from the end.
+    for (offset, line) in lines.enumerate_backward(None) {
         if line == "E: Disk space is probably not sufficient for building.\n" {
-            if let Some((_, needed, free)) = lazy_regex::regex_captures!(
-                "I: Source needs ([0-9]+) KiB, while ([0-9]+) KiB is free.\n",
-                lines[offset + 1]
-            ) {
+            if let Some((_, needed, free)) = lines
+                .get(offset + 1)
+                .and_then(|next| next.strip_prefix("I: Source needs "))
+                .and_then(|rest| {
+                    lazy_regex::regex_captures!(
+                        "^([0-9]+) KiB, while ([0-9]+) KiB is free.\n",
+                        rest
+                    )
+                })
+            {
                 return (
                     Some(Box::new(SingleLineMatch::from_lines(
                         &lines,
@@ -1272,6 +1300,81 @@ mod tests {
         );
     }
 
+    #[test]
+    fn test_patch_application_failed() {
+        let (r#match, error) = find_preamble_failure_description(vec![
+            "dpkg-source: info: applying fix-build.patch\n",
+            "dpkg-source: error: LC_ALL=C patch -t -F 0 -N -p1 -u -V never -E -b -B .pc/fix-build.patch/ --reject-file=- < foo.orig.Ab3dEf/debian/patches/fix-build.patch subprocess returned exit status 1\n",
+        ]);
+        assert_eq!(r#match.unwrap().lineno(), 2);
+        assert_eq!(
+            error,
+            Some(Box::new(PatchApplicationFailed {
+                patchname: "fix-build.patch".to_string()
+            }) as Box<dyn Problem>)
+        );
+    }
+
+    #[test]
+    fn test_arch_check_failure_description() {
+        let (m, error) = find_arch_check_failure_description(vec![
+            "E: dsc: i386 not in arch list or does not match any arch wildcards: amd64 arm64 -- skipping\n",
+        ]);
+        assert_eq!(m.unwrap().offset(), 0);
+        assert_eq!(
+            error,
+            Some(Box::new(ArchitectureNotInList {
+                arch: "i386".to_string(),
+                arch_list: vec!["amd64".to_string(), "arm64".to_string()],
+            }) as Box<dyn Problem>)
+        );
+
+        let (m, error) = find_arch_check_failure_description(vec!["foo\n", "bar\n"]);
+        assert_eq!(m.unwrap().offset(), 1);
+        assert!(error.is_none());
+
+        let (m, error) = find_arch_check_failure_description(vec![]);
+        assert!(m.is_none());
+        assert!(error.is_none());
+    }
+
+    #[test]
+    fn test_parse_sbuild_log_invalid_utf8() {
+        let log = b"foo\n\xff bar\n";
+        let sections: Vec<_> = parse_sbuild_log(&log[..]).collect();
+        assert_eq!(sections.len(), 1);
+        assert_eq!(sections[0].lines, vec!["foo\n", "\u{fffd} bar\n"]);
+    }
+
+    #[test]
+    fn test_check_space_failure_description() {
+        let (m, error) = find_check_space_failure_description(vec![
+            "foo\n",
+            "E: Disk space is probably not sufficient for building.\n",
+            "I: Source needs 1024 KiB, while 100 KiB is free.\n",
+            "bar\n",
+        ]);
+        assert_eq!(m.unwrap().offset(), 1);
+        assert_eq!(
+            error,
+            Some(Box::new(InsufficientDiskSpace {
+                needed: 1024,
+                free: 100,
+            }) as Box<dyn Problem>)
+        );
+
+        let (m, error) = find_check_space_failure_description(vec![
+            "foo\n",
+            "E: Disk space is probably not sufficient for building.\n",
+        ]);
+        assert_eq!(m.unwrap().offset(), 1);
+        assert!(error.is_none());
+
+        let (m, error) = find_check_space_failure_description(vec!["foo\n"]);
+        assert!(m.is_none());
+        assert!(error.is_none());
+    }
+
     #[test]
     fn test_strip_build_tail() {
         assert_eq!(